@@ -18,15 +18,21 @@ Author: Thomas Ribeiro
 """
 
 import sys
+import queue
 import signal
+import threading
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
+from utils import start_log_listener
 from camera import initialize_camera, cleanup_camera
-from visualization import setup_plot, update_plot, limit_plot_history, create_timer
-from acquisition import create_acquisition_state, process_frame
+from visualization import setup_plot, push_samples, redraw, create_timer
+from acquisition import (
+    create_acquisition_state, get_frame_shape, roi_slices,
+    RoiMeanEventHandler, conversion_worker
+)
 
 
 # ============================================================================
@@ -37,6 +43,8 @@ EXPOSURE_US = 5000  # Exposure time in microseconds
 ROI_SIZE = (200, 200)  # ROI dimensions (width, height)
 BASELINE_FRAMES = 50  # Number of frames to average for dark baseline
 PLOT_HISTORY = 500  # Number of frames to display in plot
+QUEUE_SIZE = 4  # Max frames buffered between acquisition and conversion
+PLOT_INTERVAL_MS = 33  # Plot refresh interval (~30 Hz)
 
 
 # ============================================================================
@@ -46,6 +54,9 @@ PLOT_HISTORY = 500  # Number of frames to display in plot
 def main():
     """Main application entry point."""
 
+    # Keep log output off the acquisition threads
+    start_log_listener()
+
     # Initialize camera
     try:
         system, cam_list, cam = initialize_camera(exposure_us=EXPOSURE_US)
@@ -57,34 +68,56 @@ def main():
     plot_dict = setup_plot(
         title="Photon Count Monitor - BFS-U3-04S2M-C",
         roi_size=ROI_SIZE,
-        exposure_us=EXPOSURE_US
+        exposure_us=EXPOSURE_US,
+        max_points=PLOT_HISTORY
     )
 
     # Create acquisition state
     acq_state = create_acquisition_state(baseline_frames=BASELINE_FRAMES)
 
-    # Data storage for plotting
-    data_x = []
-    data_y = []
+    # Three-stage pipeline: acquire (Spinnaker image events) -> convert
+    # (thread) -> plot (Qt timer), connected by bounded queues that keep only
+    # the freshest samples
+    raw_queue = queue.Queue(maxsize=QUEUE_SIZE)
+    sample_queue = queue.Queue(maxsize=PLOT_HISTORY)  # Drained once per redraw
+    stop_event = threading.Event()
+
+    event_handler = RoiMeanEventHandler(
+        roi_slices(get_frame_shape(cam), ROI_SIZE), raw_queue
+    )
+    cam.RegisterEventHandler(event_handler)
+
+    converter = threading.Thread(
+        target=conversion_worker,
+        args=(acq_state, raw_queue, sample_queue, stop_event),
+        daemon=True
+    )
+    converter.start()
 
     # Start acquisition
     cam.BeginAcquisition()
     is_acquiring = True
     print(f"Acquiring {BASELINE_FRAMES} frames for dark baseline calibration...")
 
-    # Timer callback for frame acquisition and plot update
+    # Plot refresh on the GUI thread: move new samples into the plot history
+    # and redraw once per tick, independent of the camera frame rate
     def update():
-        """Process one frame and update plot."""
-        photons = process_frame(cam, acq_state, ROI_SIZE)
-
-        # Update plot only after calibration is complete
-        # Note: photons can be 0 if signal is darker than baseline (correct behavior)
-        if photons is not None and acq_state['is_calibrated']:
-            update_plot(plot_dict, data_x, data_y, acq_state['frame_idx'], photons)
-            limit_plot_history(data_x, data_y, PLOT_HISTORY)
-
-    # Setup timer for continuous acquisition
-    timer = create_timer(callback=update, interval_ms=0)
+        """Push samples produced since the last tick and redraw the plot."""
+        frame_numbers = []
+        photon_counts = []
+        while True:
+            try:
+                frame_idx, photons = sample_queue.get_nowait()
+            except queue.Empty:
+                break
+            frame_numbers.append(frame_idx)
+            photon_counts.append(photons)
+
+        if frame_numbers:
+            push_samples(plot_dict, frame_numbers, photon_counts)
+        redraw(plot_dict)
+
+    timer = create_timer(callback=update, interval_ms=PLOT_INTERVAL_MS)
     timer.start()
 
     # Cleanup handler
@@ -92,7 +125,10 @@ def main():
         """Cleanup camera resources on exit."""
         nonlocal is_acquiring
         timer.stop()
-        cleanup_camera(system, cam_list, cam, is_acquiring=is_acquiring)
+        stop_event.set()
+        converter.join()
+        cleanup_camera(system, cam_list, cam, is_acquiring=is_acquiring,
+                       event_handler=event_handler)
         is_acquiring = False
 
     # Register cleanup on window close
@@ -6,18 +6,43 @@ performing baseline calibration, and converting to photon counts
 using pure procedural programming.
 """
 
+import queue
+import logging
+import threading
 import numpy as np
 import PySpin
-from typing import Optional, Tuple, Dict, List
+from typing import Optional, Tuple, Dict, List, Any
 from photon_conversion import adu_to_photons, SYSTEM_GAIN, QE_AT_525NM
 
+try:
+    import cv2
+except ImportError:  # OpenCV is optional - ROI means fall back to numpy
+    cv2 = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - ROI means fall back to numpy
+    njit = None
+
+# Per-frame messages go through logging so no blocking I/O runs in the hot
+# path once a queued handler is installed (see utils.start_log_listener)
+logger = logging.getLogger(__name__)
+
+# Single-channel dtypes cv2.mean accepts
+_CV2_MEAN_DTYPES = frozenset(np.dtype(t) for t in (
+    np.uint8, np.int8, np.uint16, np.int16, np.int32, np.float32, np.float64
+))
+
 
 def acquire_frame(cam: PySpin.Camera, timeout_ms: int = 1000) -> Optional[np.ndarray]:
     """
     Acquire a single frame from the camera.
 
-    NOTE: Returns a numpy array view. The PySpin image is released immediately
-    to avoid memory buildup. Only the array data is kept temporarily.
+    Polling mode (GetNextImage). The live monitor does not use this; it
+    receives frames through RoiMeanEventHandler instead.
+
+    NOTE: Returns a copy of the image data. The PySpin image is released
+    immediately to avoid memory buildup.
 
     Parameters
     ----------
@@ -41,18 +66,123 @@ def acquire_frame(cam: PySpin.Camera, timeout_ms: int = 1000) -> Optional[np.nda
         img = cam.GetNextImage(timeout_ms)
 
         if img.IsIncomplete():
-            print(f"Frame incomplete: {img.GetImageStatus()}")
+            logger.warning("Frame incomplete: %s", img.GetImageStatus())
             img.Release()
             return None
 
-        # Get numpy array - this creates a copy, not a reference
+        # GetNDArray() is a view into the camera buffer - copy before releasing
         arr = img.GetNDArray().copy()
         # Release the PySpin image immediately to free camera buffer
         img.Release()
         return arr
 
     except PySpin.SpinnakerException as e:
-        print(f"Spinnaker exception: {e}")
+        logger.warning("Spinnaker exception: %s", e)
+        return None
+
+
+def get_frame_shape(cam: PySpin.Camera) -> Tuple[int, int]:
+    """
+    Get the shape of frames delivered by the camera.
+
+    Parameters
+    ----------
+    cam : PySpin.Camera
+        Camera instance (initialized)
+
+    Returns
+    -------
+    tuple of int
+        Frame shape (height, width), as returned by GetNDArray()
+
+    Examples
+    --------
+    >>> h, w = get_frame_shape(cam)
+    """
+    return cam.Height.GetValue(), cam.Width.GetValue()
+
+
+def roi_slices(
+    shape: Tuple[int, int],
+    roi_size: Tuple[int, int]
+) -> Tuple[slice, slice]:
+    """
+    Compute the index of a centered ROI.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Full frame shape (height, width)
+    roi_size : tuple of int
+        ROI dimensions (width, height)
+
+    Returns
+    -------
+    tuple of slice
+        (row_slice, col_slice), usable directly as image[roi_slice]
+
+    Examples
+    --------
+    >>> roi_slice = roi_slices(image.shape, roi_size=(200, 200))
+    >>> roi = image[roi_slice]
+    """
+    h, w = shape
+    roi_w, roi_h = roi_size
+
+    # Calculate centered ROI coordinates
+    x0 = w // 2 - roi_w // 2
+    y0 = h // 2 - roi_h // 2
+
+    return slice(y0, y0 + roi_h), slice(x0, x0 + roi_w)
+
+
+def acquire_roi_mean(
+    cam: PySpin.Camera,
+    roi_slice: Tuple[slice, slice],
+    timeout_ms: int = 1000
+) -> Optional[float]:
+    """
+    Acquire a single frame and reduce its ROI to a mean without copying.
+
+    Polling counterpart of RoiMeanEventHandler, which the live monitor
+    uses instead.
+
+    GetNDArray() is a view into the camera buffer, so the ROI is reduced
+    in place before the PySpin image is released - no pixel data is copied.
+
+    Parameters
+    ----------
+    cam : PySpin.Camera
+        Camera instance
+    roi_slice : tuple of slice
+        ROI index from roi_slices()
+    timeout_ms : int, optional
+        Image acquisition timeout in milliseconds. Default is 1000
+
+    Returns
+    -------
+    float or None
+        Mean ROI level in ADU, or None if incomplete or timeout
+
+    Examples
+    --------
+    >>> roi_slice = roi_slices(get_frame_shape(cam), roi_size=(200, 200))
+    >>> mean_adu = acquire_roi_mean(cam, roi_slice)
+    """
+    try:
+        img = cam.GetNextImage(timeout_ms)
+
+        try:
+            if img.IsIncomplete():
+                logger.warning("Frame incomplete: %s", img.GetImageStatus())
+                return None
+            return roi_mean(img.GetNDArray()[roi_slice])
+        finally:
+            # The view is invalid after this - only the mean survives
+            img.Release()
+
+    except PySpin.SpinnakerException as e:
+        logger.warning("Spinnaker exception: %s", e)
         return None
 
 
@@ -77,16 +207,83 @@ def extract_roi(image: np.ndarray, roi_size: Tuple[int, int]) -> np.ndarray:
     >>> roi = extract_roi(image, roi_size=(200, 200))
     >>> print(f"ROI shape: {roi.shape}")
     """
-    h, w = image.shape
-    roi_w, roi_h = roi_size
+    return image[roi_slices(image.shape, roi_size)]
 
-    # Calculate centered ROI coordinates
-    x0 = w // 2 - roi_w // 2
-    y0 = h // 2 - roi_h // 2
 
-    # Extract ROI
-    roi = image[y0:y0 + roi_h, x0:x0 + roi_w]
-    return roi
+def accumulator_dtype(roi: np.ndarray) -> np.dtype:
+    """
+    Get the narrowest dtype that can sum an ROI without overflow.
+
+    Unsigned camera data is summed in uint32 whenever the worst case fits
+    (e.g. 200x200 px of uint16 < 2^32), avoiding float64 temporaries.
+
+    Parameters
+    ----------
+    roi : np.ndarray
+        ROI region
+
+    Returns
+    -------
+    np.dtype
+        uint32 or uint64 for unsigned data, float64 otherwise
+
+    Examples
+    --------
+    >>> accumulator_dtype(np.zeros((200, 200), dtype=np.uint16))
+    dtype('uint32')
+    """
+    if roi.dtype.kind != 'u':
+        return np.dtype(np.float64)
+    max_sum = int(np.iinfo(roi.dtype).max) * roi.size
+    if max_sum <= np.iinfo(np.uint32).max:
+        return np.dtype(np.uint32)
+    return np.dtype(np.uint64)
+
+
+def _roi_sum(roi):
+    """Sum a 2D unsigned ROI in a single fused pass (numba-compiled)."""
+    total = 0
+    for i in range(roi.shape[0]):
+        for j in range(roi.shape[1]):
+            total += roi[i, j]
+    return total
+
+
+# Only worth using when compiled - the interpreted loop is far slower than numpy
+_roi_sum_jit = njit(cache=True, nogil=True)(_roi_sum) if njit is not None else None
+
+
+def roi_mean(roi: np.ndarray) -> float:
+    """
+    Calculate the mean pixel value of an ROI.
+
+    Backends are tried in a fixed order:
+
+    1. numba-compiled summation kernel (2D unsigned ROIs, exact integer sum)
+    2. OpenCV's SIMD-accelerated cv2.mean (other dtypes it accepts)
+    3. single-pass numpy sum in the narrowest safe accumulator
+
+    Each step is skipped when its package is not installed.
+
+    Parameters
+    ----------
+    roi : np.ndarray
+        ROI region
+
+    Returns
+    -------
+    float
+        Mean pixel value
+
+    Examples
+    --------
+    >>> mean_adu = roi_mean(extract_roi(image, (200, 200)))
+    """
+    if _roi_sum_jit is not None and roi.ndim == 2 and roi.dtype.kind == 'u':
+        return _roi_sum_jit(roi) / roi.size
+    if cv2 is not None and roi.dtype in _CV2_MEAN_DTYPES:
+        return cv2.mean(roi)[0]
+    return float(np.add.reduce(roi, axis=None, dtype=accumulator_dtype(roi))) / roi.size
 
 
 def create_acquisition_state(
@@ -109,8 +306,9 @@ def create_acquisition_state(
     Returns
     -------
     dict
-        State dictionary with keys: 'frame_idx', 'baseline_vals', 'mean_dark',
-        'is_calibrated', 'baseline_frames', 'gain', 'qe'
+        State dictionary with keys: 'frame_idx', 'baseline_count',
+        'baseline_mean', 'baseline_m2', 'mean_dark', 'is_calibrated',
+        'baseline_frames', 'gain', 'qe', 'adu_to_photon_scale', 'roi_slice'
 
     Examples
     --------
@@ -120,25 +318,32 @@ def create_acquisition_state(
     """
     return {
         'frame_idx': 0,
-        'baseline_vals': [],
+        'baseline_count': 0,
+        'baseline_mean': 0.0,  # Running mean of baseline frames (Welford)
+        'baseline_m2': 0.0,  # Running sum of squared deviations (Welford)
         'mean_dark': 0.0,
         'is_calibrated': False,
         'baseline_frames': baseline_frames,
         'gain': gain,
-        'qe': quantum_efficiency
+        'qe': quantum_efficiency,
+        'adu_to_photon_scale': gain / quantum_efficiency,  # photons per ADU
+        'roi_slice': None  # ROI index, computed on first frame
     }
 
 
-def process_frame(
+def measure_roi(
     cam: PySpin.Camera,
     state: Dict,
     roi_size: Tuple[int, int],
     timeout_ms: int = 1000
 ) -> Optional[float]:
     """
-    Acquire and process a single frame.
+    Acquire a single frame and return the mean ADU of the centered ROI.
 
-    Handles baseline calibration phase and photon conversion.
+    This is the acquisition stage of process_frame(); it only touches the
+    'roi_slice' entry of the state.
+
+    Polling mode only, like acquire_roi_mean().
 
     Parameters
     ----------
@@ -154,57 +359,239 @@ def process_frame(
     Returns
     -------
     float or None
-        Photon count per pixel, or None if frame acquisition failed.
+        Mean ROI level in ADU, or None if frame acquisition failed
+
+    Examples
+    --------
+    >>> mean_adu = measure_roi(cam, state, roi_size=(200, 200))
+    """
+    # ROI index is fixed for the session - compute it once
+    if state['roi_slice'] is None:
+        state['roi_slice'] = roi_slices(get_frame_shape(cam), roi_size)
+
+    # Reduce the ROI straight from the camera buffer - nothing is copied
+    return acquire_roi_mean(cam, state['roi_slice'], timeout_ms)
+
+
+def convert_sample(state: Dict, mean_adu: Optional[float]) -> Optional[float]:
+    """
+    Convert a mean ROI level to photons, handling baseline calibration.
+
+    Called by conversion_worker() for every value published by
+    RoiMeanEventHandler. Every call advances the frame counter, including
+    failed acquisitions (mean_adu is None).
+
+    Parameters
+    ----------
+    state : dict
+        Acquisition state from create_acquisition_state()
+    mean_adu : float or None
+        Mean ROI level in ADU, or None for an incomplete frame
+
+    Returns
+    -------
+    float or None
+        Photon count per pixel, or None if mean_adu is None.
         Returns 0 during baseline calibration phase.
 
     Examples
     --------
-    >>> state = create_acquisition_state()
-    >>> photons = process_frame(cam, state, roi_size=(200, 200))
+    >>> photons = convert_sample(state, mean_adu)
     """
-    # Acquire frame
-    image = acquire_frame(cam, timeout_ms)
-    if image is None:
+    if mean_adu is None:
         state['frame_idx'] += 1
         return None
 
-    # Extract ROI and calculate mean immediately
-    roi = extract_roi(image, roi_size)
-    mean_adu = float(roi.mean())
-
-    # Delete full image to free memory immediately - we only need the mean
-    del image, roi
-
     # Baseline calibration phase
     if not state['is_calibrated']:
-        state['baseline_vals'].append(mean_adu)
+        # Welford's single-pass update of baseline mean and variance
+        n = state['baseline_count'] + 1
+        delta = mean_adu - state['baseline_mean']
+        state['baseline_mean'] += delta / n
+        state['baseline_m2'] += delta * (mean_adu - state['baseline_mean'])
+        state['baseline_count'] = n
         state['frame_idx'] += 1
 
-        if len(state['baseline_vals']) >= state['baseline_frames']:
+        if state['baseline_count'] >= state['baseline_frames']:
             complete_calibration(state)
 
         return 0  # Return 0 photons during calibration
 
-    # Convert to photons
-    photons = adu_to_photons(
-        signal_adu=mean_adu,
-        dark_adu=state['mean_dark'],
-        gain=state['gain'],
-        quantum_efficiency=state['qe']
-    )
+    # Convert to photons - inlined adu_to_photons() with precomputed gain / QE
+    photons = max(0.0, mean_adu - state['mean_dark']) * state['adu_to_photon_scale']
 
     state['frame_idx'] += 1
 
     # Debug output every 100 frames
     if state['frame_idx'] % 100 == 0:
-        delta = mean_adu - state['mean_dark']
-        print(f"Frame {state['frame_idx']}: {photons:.1f} photons/px | "
-              f"ADU: {mean_adu:.1f} | Dark: {state['mean_dark']:.1f} | "
-              f"Delta: {delta:.1f}")
+        logger.info(
+            "Frame %d: %.1f photons/px | ADU: %.1f | Dark: %.1f | Delta: %.1f",
+            state['frame_idx'], photons, mean_adu, state['mean_dark'],
+            mean_adu - state['mean_dark']
+        )
 
     return photons
 
 
+def process_frame(
+    cam: PySpin.Camera,
+    state: Dict,
+    roi_size: Tuple[int, int],
+    timeout_ms: int = 1000
+) -> Optional[float]:
+    """
+    Acquire and process a single frame.
+
+    Handles baseline calibration phase and photon conversion. Equivalent
+    to convert_sample(state, measure_roi(cam, state, roi_size, timeout_ms)).
+
+    Polling-mode API for scripts; the live monitor runs RoiMeanEventHandler
+    and conversion_worker() instead.
+
+    Parameters
+    ----------
+    cam : PySpin.Camera
+        Camera instance
+    state : dict
+        Acquisition state from create_acquisition_state()
+    roi_size : tuple of int
+        ROI dimensions (width, height)
+    timeout_ms : int, optional
+        Acquisition timeout in milliseconds. Default is 1000
+
+    Returns
+    -------
+    float or None
+        Photon count per pixel, or None if frame acquisition failed.
+        Returns 0 during baseline calibration phase.
+
+    Examples
+    --------
+    >>> state = create_acquisition_state()
+    >>> photons = process_frame(cam, state, roi_size=(200, 200))
+    """
+    return convert_sample(state, measure_roi(cam, state, roi_size, timeout_ms))
+
+
+def put_latest(q: queue.Queue, item: Any):
+    """
+    Put an item on a bounded queue, dropping the oldest entry if it is full.
+
+    Keeps only the freshest samples when the consumer falls behind, so the
+    producer never blocks.
+
+    Parameters
+    ----------
+    q : queue.Queue
+        Bounded queue
+    item : any
+        Item to enqueue
+
+    Examples
+    --------
+    >>> q = queue.Queue(maxsize=4)
+    >>> put_latest(q, 1000.0)
+    """
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+
+class RoiMeanEventHandler(PySpin.ImageEventHandler):
+    """
+    Image event handler that publishes the mean ROI ADU of every frame.
+
+    Spinnaker invokes OnImageEvent from its own acquisition thread as soon as
+    a frame arrives, so no Python thread has to poll GetNextImage. Each
+    frame's ROI is reduced in place and the mean is pushed onto out_queue
+    with put_latest(). Incomplete frames are pushed as None so the
+    conversion stage keeps frame numbering intact.
+
+    Parameters
+    ----------
+    roi_slice : tuple of slice
+        ROI index from roi_slices()
+    out_queue : queue.Queue
+        Bounded queue receiving mean ADU values (or None)
+
+    Examples
+    --------
+    >>> q_raw = queue.Queue(maxsize=4)
+    >>> handler = RoiMeanEventHandler(roi_slices(get_frame_shape(cam), (200, 200)), q_raw)
+    >>> cam.RegisterEventHandler(handler)
+    >>> cam.BeginAcquisition()
+    """
+
+    def __init__(self, roi_slice: Tuple[slice, slice], out_queue: queue.Queue):
+        super().__init__()
+        self._roi_slice = roi_slice
+        self._out_queue = out_queue
+
+    def OnImageEvent(self, image: PySpin.ImagePtr):
+        """Reduce the ROI of a newly arrived frame and publish its mean."""
+        # Spinnaker recycles the image buffer once this callback returns
+        if image.IsIncomplete():
+            logger.warning("Frame incomplete: %s", image.GetImageStatus())
+            mean_adu = None
+        else:
+            mean_adu = roi_mean(image.GetNDArray()[self._roi_slice])
+
+        put_latest(self._out_queue, mean_adu)
+
+
+def conversion_worker(
+    state: Dict,
+    in_queue: queue.Queue,
+    out_queue: queue.Queue,
+    stop_event: threading.Event,
+    poll_s: float = 0.1
+):
+    """
+    Conversion stage: turn mean ADU values into calibrated photon samples.
+
+    Intended as a thread target. Pops values produced by RoiMeanEventHandler,
+    runs them through convert_sample(), and pushes each calibrated
+    (frame_idx, photons) sample onto out_queue.
+
+    Parameters
+    ----------
+    state : dict
+        Acquisition state from create_acquisition_state()
+    in_queue : queue.Queue
+        Queue of mean ADU values (or None)
+    out_queue : queue.Queue
+        Bounded queue receiving (frame_idx, photons) tuples
+    stop_event : threading.Event
+        Set to stop the loop
+    poll_s : float, optional
+        How often to check stop_event while idle, in seconds. Default is 0.1
+
+    Examples
+    --------
+    >>> q_phot = queue.Queue(maxsize=4)
+    >>> t = threading.Thread(target=conversion_worker,
+    ...                      args=(state, q_raw, q_phot, stop), daemon=True)
+    >>> t.start()
+    """
+    while not stop_event.is_set():
+        try:
+            mean_adu = in_queue.get(timeout=poll_s)
+        except queue.Empty:
+            continue
+
+        photons = convert_sample(state, mean_adu)
+
+        # Note: photons can be 0 if signal is darker than baseline (correct behavior)
+        if photons is not None and state['is_calibrated']:
+            put_latest(out_queue, (state['frame_idx'], photons))
+
+
 def complete_calibration(state: Dict):
     """
     Complete baseline calibration and print statistics.
@@ -220,8 +607,8 @@ def complete_calibration(state: Dict):
     --------
     >>> complete_calibration(state)
     """
-    state['mean_dark'] = np.mean(state['baseline_vals'])
-    dark_std = np.std(state['baseline_vals'])
+    state['mean_dark'] = state['baseline_mean']
+    dark_std = np.sqrt(state['baseline_m2'] / state['baseline_count'])
 
     print(f"\nBaseline calibration complete!")
     print(f"Mean dark level: {state['mean_dark']:.2f} ADU")
@@ -247,7 +634,9 @@ def reset_calibration(state: Dict):
     --------
     >>> reset_calibration(state)
     """
-    state['baseline_vals'].clear()
+    state['baseline_count'] = 0
+    state['baseline_mean'] = 0.0
+    state['baseline_m2'] = 0.0
     state['mean_dark'] = 0.0
     state['is_calibrated'] = False
     state['frame_idx'] = 0
@@ -275,7 +664,7 @@ def get_calibration_progress(state: Dict) -> float:
     """
     if state['is_calibrated']:
         return 1.0
-    return len(state['baseline_vals']) / state['baseline_frames']
+    return state['baseline_count'] / state['baseline_frames']
 
 
 def calculate_roi_photons(
@@ -317,7 +706,7 @@ def calculate_roi_photons(
     roi = extract_roi(image, roi_size)
 
     # Calculate mean ADU
-    mean_adu = float(roi.mean())
+    mean_adu = roi_mean(roi)
 
     # Convert to photons
     photons = adu_to_photons(
@@ -6,13 +6,13 @@ and resource management using pure procedural programming.
 """
 
 import PySpin
-import gc
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional
 
 
 def initialize_camera(
     exposure_us: int = 5000,
-    camera_index: int = 0
+    camera_index: int = 0,
+    buffer_count: int = 3
 ) -> Tuple[PySpin.System, PySpin.CameraList, PySpin.Camera]:
     """
     Initialize camera and return system, cam_list, and cam objects.
@@ -23,6 +23,8 @@ def initialize_camera(
         Exposure time in microseconds. Default is 5000
     camera_index : int, optional
         Index of camera to use. Default is 0
+    buffer_count : int, optional
+        Number of stream buffers. Default is 3
 
     Returns
     -------
@@ -67,6 +69,9 @@ def initialize_camera(
     # Configure exposure
     configure_exposure(cam, exposure_us)
 
+    # Configure stream buffers (must happen before BeginAcquisition)
+    configure_stream_buffers(cam, buffer_count)
+
     print("Camera initialized successfully")
     return system, cam_list, cam
 
@@ -91,6 +96,33 @@ def configure_exposure(cam: PySpin.Camera, exposure_us: int):
     print(f"Exposure time set to {exposure_us} us")
 
 
+def configure_stream_buffers(cam: PySpin.Camera, buffer_count: int = 3):
+    """
+    Configure the stream to hand out the newest frame from a small buffer pool.
+
+    Spinnaker defaults to an automatically sized pool delivered oldest-first,
+    so GetNextImage returns increasingly stale frames whenever the consumer
+    falls behind. A short pool with NewestOnly handling keeps latency low for
+    live monitoring. Must be called before BeginAcquisition.
+
+    Parameters
+    ----------
+    cam : PySpin.Camera
+        Camera instance
+    buffer_count : int, optional
+        Number of stream buffers. Default is 3
+
+    Examples
+    --------
+    >>> configure_stream_buffers(cam, buffer_count=3)
+    """
+    stream = cam.TLStream
+    stream.StreamBufferCountMode.SetValue(PySpin.StreamBufferCountMode_Manual)
+    stream.StreamBufferCountManual.SetValue(buffer_count)
+    stream.StreamBufferHandlingMode.SetValue(PySpin.StreamBufferHandlingMode_NewestOnly)
+    print(f"Stream buffers set to {buffer_count} (newest only)")
+
+
 def get_camera_info(cam: PySpin.Camera) -> Dict[str, str]:
     """
     Get camera information from device node map.
@@ -135,7 +167,8 @@ def cleanup_camera(
     system: PySpin.System,
     cam_list: PySpin.CameraList,
     cam: PySpin.Camera,
-    is_acquiring: bool = False
+    is_acquiring: bool = False,
+    event_handler: Optional[PySpin.ImageEventHandler] = None
 ):
     """
     Cleanup camera resources to avoid interface errors.
@@ -153,6 +186,9 @@ def cleanup_camera(
         Camera instance
     is_acquiring : bool, optional
         Whether camera is currently acquiring. Default is False
+    event_handler : PySpin.ImageEventHandler, optional
+        Image event handler registered on the camera, unregistered before
+        DeInit. Default is None
 
     Examples
     --------
@@ -167,24 +203,31 @@ def cleanup_camera(
         except PySpin.SpinnakerException as e:
             print(f"Warning: Error ending acquisition: {e}")
 
+    # Unregister image events (must happen before DeInit)
+    if event_handler is not None:
+        try:
+            cam.UnregisterEventHandler(event_handler)
+        except PySpin.SpinnakerException as e:
+            print(f"Warning: Error unregistering event handler: {e}")
+
     # Deinitialize camera
     try:
         cam.DeInit()
     except PySpin.SpinnakerException as e:
         print(f"Warning: Error during camera DeInit: {e}")
 
-    # CRITICAL ORDER: Delete camera object BEFORE clearing camera list
+    # CRITICAL ORDER: Drop our camera reference BEFORE clearing camera list.
+    # PySpin wrappers are released when their last reference goes away, so
+    # no gc.collect() is needed - but del only drops this local name; the
+    # camera lives on while the caller still holds cam or event_handler.
     del cam
-    gc.collect()
 
     # Now clear the camera list
     cam_list.Clear()
     del cam_list
-    gc.collect()
 
     # Finally release system
     system.ReleaseInstance()
     del system
-    gc.collect()
 
     print("Camera resources released cleanly")
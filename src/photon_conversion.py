@@ -19,6 +19,11 @@ References:
 import numpy as np
 from typing import Union, Optional
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional - scalar path falls back to plain Python
+    njit = None
+
 
 # EMVA 1288 measured parameters for BFS-U3-04S2M-C
 SYSTEM_GAIN = 0.35  # electrons per ADU
@@ -27,11 +32,22 @@ SATURATION_ELECTRONS = 22187  # Full well capacity
 READ_NOISE_ELECTRONS = 3.71  # Temporal dark noise
 
 
+def _adu_to_photons_scalar(signal, dark, gain, qe):
+    """Scalar fast path of adu_to_photons(), JIT-compiled when numba is available."""
+    delta = signal - dark
+    return (delta if delta > 0 else 0.0) * (gain / qe)
+
+
+if njit is not None:
+    _adu_to_photons_scalar = njit(cache=True, fastmath=True)(_adu_to_photons_scalar)
+
+
 def adu_to_photons(
     signal_adu: Union[float, np.ndarray],
     dark_adu: Union[float, np.ndarray] = 0.0,
     gain: float = SYSTEM_GAIN,
     quantum_efficiency: float = QE_AT_525NM,
+    out: Optional[np.ndarray] = None,
 ) -> Union[float, np.ndarray]:
     """
     Convert camera ADU values to incident photon count.
@@ -53,11 +69,14 @@ def adu_to_photons(
         System gain in electrons/ADU. Default is 0.35 e⁻/ADU (BFS-U3-04S2M-C)
     quantum_efficiency : float, optional
         Quantum efficiency (0-1 range). Default is 0.6182 at 525nm
+    out : np.ndarray, optional
+        Preallocated float array for the result, reused across calls to
+        avoid allocation. Ignored for scalar inputs. Default is None
 
     Returns
     -------
     float or np.ndarray
-        Estimated incident photon count
+        Estimated incident photon count (out, if given)
 
     Examples
     --------
@@ -74,27 +93,44 @@ def adu_to_photons(
     >>> print(f"Mean photons/pixel: {photons.mean():.1f}")
     Mean photons/pixel: 504.6
 
+    >>> # Reuse an output buffer across frames
+    >>> photon_map = np.empty(roi.shape, dtype=np.float32)
+    >>> adu_to_photons(roi, dark, out=photon_map)
+
     Notes
     -----
     - This assumes shot-noise-limited regime where signal >> read noise
     - For low light levels (< 10 photons/pixel), read noise becomes significant
     - The result represents photons incident on the sensor, not photons absorbed
     - Negative values are clipped to zero (cannot have negative photon counts)
+    - Scalar inputs take a numba-compiled fast path when numba is installed
     """
-    # Subtract dark baseline
-    delta_adu = signal_adu - dark_adu
+    # Per-frame scalar calls skip numpy dispatch entirely
+    if isinstance(signal_adu, (int, float)) and isinstance(dark_adu, (int, float)):
+        return _adu_to_photons_scalar(signal_adu, dark_adu, gain, quantum_efficiency)
+
+    # Single float result buffer; every step below runs in place
+    scalar_result = out is None and np.ndim(signal_adu) == 0 and np.ndim(dark_adu) == 0
+    if out is None:
+        out = np.empty(
+            np.broadcast(signal_adu, dark_adu).shape,
+            dtype=np.result_type(signal_adu, dark_adu, 1.0)
+        )
+
+    # Subtract dark baseline in the float dtype, so integer inputs cannot
+    # wrap around below the dark level
+    np.subtract(signal_adu, dark_adu, out=out, dtype=out.dtype)
 
     # Clip negative values to zero (cannot have negative photon counts)
-    if isinstance(delta_adu, np.ndarray):
-        delta_adu = np.maximum(delta_adu, 0)
-    else:
-        delta_adu = max(0, delta_adu)
+    np.maximum(out, 0, out=out)
 
     # Convert ADU → electrons → photons
-    electrons = delta_adu * gain
-    photons = electrons / quantum_efficiency
+    np.multiply(out, gain / quantum_efficiency, out=out)
 
-    return photons
+    # NumPy scalar inputs give back a scalar, like Python numbers do
+    if scalar_result:
+        return out[()]
+    return out
 
 
 def adu_to_electrons(
@@ -119,12 +155,11 @@ def adu_to_electrons(
     float or np.ndarray
         Photoelectron count
     """
-    delta_adu = signal_adu - dark_adu
-
-    if isinstance(delta_adu, np.ndarray):
-        delta_adu = np.maximum(delta_adu, 0)
-    else:
-        delta_adu = max(0, delta_adu)
+    # Subtract in float so unsigned frames cannot wrap below the dark level
+    delta_adu = np.maximum(
+        np.subtract(signal_adu, dark_adu, dtype=np.result_type(signal_adu, dark_adu, 1.0)),
+        0
+    )
 
     return delta_adu * gain
 
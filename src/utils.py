@@ -1,3 +1,9 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
 
 def enable_autoreload():
     """
@@ -30,4 +36,43 @@ def enable_autoreload():
     except ImportError:
         print("Warning: IPython not available, autoreload not enabled")
     except Exception as e:
-        print(f"Warning: Could not enable autoreload: {e}")
\ No newline at end of file
+        print(f"Warning: Could not enable autoreload: {e}")
+
+
+def start_log_listener(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Route logging through a queue so writes happen on a background thread.
+
+    Installs a QueueHandler on the root logger; a QueueListener thread does
+    the actual (potentially blocking) writes to stderr. Threads that log,
+    such as the acquisition pipeline, only pay for a queue put. The listener
+    is stopped automatically at interpreter exit.
+
+    Parameters
+    ----------
+    level : int, optional
+        Root logger level. Default is logging.INFO
+
+    Returns
+    -------
+    logging.handlers.QueueListener
+        The running listener
+
+    Example
+    -------
+    >>> from utils import start_log_listener
+    >>> listener = start_log_listener()
+    """
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+
+    return listener
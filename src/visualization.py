@@ -7,14 +7,32 @@ Provides functions for creating and updating plots using pure procedural program
 import numpy as np
 import pyqtgraph as pg
 from pyqtgraph.Qt import QtCore, QtWidgets
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, Sequence
+
+# Fast line rendering: no antialiasing, and OpenGL when PyOpenGL is installed
+pg.setConfigOptions(antialias=False)
+try:
+    import OpenGL  # noqa: F401
+    pg.setConfigOptions(useOpenGL=True, enableExperimental=True)
+except ImportError:
+    pass
+
+# Minimum time between text overlay refreshes in ms (20 Hz)
+UI_REFRESH_MS = 50
+
+# Plot axis labels
+_AXIS_LABELS = {'bottom': 'Frame Number', 'left': 'Photons / pixel / exposure'}
+
+# Text overlay format: current and mean photon count
+_TEXT_TEMPLATE = "Current: {:.1f} photons/px\nMean: {:.1f} photons/px"
 
 
 def setup_plot(
     title: str = "Photon Count Monitor",
     roi_size: Tuple[int, int] = (200, 200),
     exposure_us: int = 5000,
-    window_size: Tuple[int, int] = (1000, 600)
+    window_size: Tuple[int, int] = (1000, 600),
+    max_points: int = 500
 ) -> Dict:
     """
     Setup PyQtGraph visualization components.
@@ -29,11 +47,15 @@ def setup_plot(
         Exposure time in microseconds. Default is 5000
     window_size : tuple of int, optional
         Window size (width, height). Default is (1000, 600)
+    max_points : int, optional
+        Number of points kept in the plot history. Default is 500
 
     Returns
     -------
     dict
-        Dictionary containing: 'app', 'win', 'plot', 'curve', 'text'
+        Dictionary containing: 'app', 'win', 'plot', 'curve' (a
+        StreamingCurve), 'text', 'history' (the curve's ring),
+        'ui_elapsed', 'text_due_ms' and 'text_dirty'
 
     Examples
     --------
@@ -53,113 +75,503 @@ def setup_plot(
     # Create plot
     roi_w, roi_h = roi_size
     plot_title = f"ROI: {roi_w}x{roi_h} px | Exposure: {exposure_us} us"
-    plot = win.addPlot(
-        title=plot_title,
-        labels={'bottom': 'Frame Number', 'left': 'Photons / pixel / exposure'}
-    )
+    plot = win.addPlot(title=plot_title, labels=_AXIS_LABELS)
     plot.showGrid(x=True, y=True, alpha=0.3)
-    plot.setDownsampling(mode='peak')
-    plot.setClipToView(True)
 
-    # Create curve
-    curve = plot.plot(pen=pg.mkPen(color='y', width=2))
-
-    # Add text overlay
-    text = pg.TextItem(anchor=(0, 1))
-    plot.addItem(text)
-    text.setPos(0, 0)
+    # Create curve (photon counts are always finite and contiguous - skip the
+    # NaN/Inf scan and connectivity check)
+    curve = StreamingCurve(
+        max_points,
+        pen=pg.mkPen(color='y', width=1),
+        skipFiniteCheck=True,
+        connect='all'
+    )
+    plot.addItem(curve)
 
-    # Show window
-    win.show()
+    # Add text overlay, pinned to the top-left corner of the view (pixel
+    # coordinates) so it never has to follow the data
+    text = pg.TextItem(anchor=(0, 0))
+    text.setParentItem(plot.getViewBox())
+    text.setPos(10, 10)
 
-    return {
+    plot_dict = {
         'app': app,
         'win': win,
         'plot': plot,
         'curve': curve,
-        'text': text
+        'text': text,
+        'history': curve.history,
+        'ui_elapsed': QtCore.QElapsedTimer(),  # since setup_plot()
+        'text_due_ms': 0,  # ui_elapsed time of the next text refresh
+        'text_dirty': False  # curve has points the overlay does not show
     }
 
+    # Cache the downsampling target (2x view width in px); only changes when
+    # the view is resized
+    def on_view_resized(view_box):
+        curve.max_draw_points = 2 * max(int(view_box.width()), 1)
 
-def update_plot(
-    plot_dict: Dict,
-    data_x: List[int],
-    data_y: List[float],
-    frame_number: int,
-    photon_count: float
+    plot.getViewBox().sigResized.connect(on_view_resized)
+
+    # Clock for the text overlay schedule, tracked natively by Qt
+    plot_dict['ui_elapsed'].start()
+
+    # Show window
+    win.show()
+    on_view_resized(plot.getViewBox())
+
+    return plot_dict
+
+
+def create_plot_history(max_points: int = 500) -> Dict:
+    """
+    Create a fixed-size ring buffer for plot history.
+
+    Each array holds two copies of the ring back to back, and every sample is
+    written to both halves. The last max_points samples are then always one
+    contiguous slice, so history_view() never allocates or copies.
+
+    Parameters
+    ----------
+    max_points : int, optional
+        Maximum number of points to keep. Default is 500
+
+    Returns
+    -------
+    dict
+        History dictionary with keys: 'x' (frame numbers), 'y' (photon counts),
+        'write_idx', 'filled', 'max_points', 'sum_y'
+
+    Examples
+    --------
+    >>> history = create_plot_history(max_points=500)
+    """
+    return {
+        # Narrow dtypes halve the bytes pyqtgraph moves per setData; int32
+        # frame numbers last for months at camera frame rates
+        'x': np.empty(2 * max_points, dtype=np.int32),
+        'y': np.empty(2 * max_points, dtype=np.float32),
+        'write_idx': 0,
+        'filled': 0,
+        'max_points': max_points,
+        'sum_y': 0.0  # Running sum of the y values in the window
+    }
+
+
+def append_history(history: Dict, frame_number: int, photon_count: float):
+    """
+    Append a data point to the plot history, overwriting the oldest when full.
+
+    Modifies history in-place in O(1), including the running sum of y.
+
+    Parameters
+    ----------
+    history : dict
+        Dictionary from create_plot_history()
+    frame_number : int
+        Frame number
+    photon_count : float
+        Photon count
+
+    Examples
+    --------
+    >>> append_history(history, 100, 500.5)
+    """
+    max_points = history['max_points']
+    y = history['y']
+    idx = history['write_idx'] % max_points
+
+    # Evict the oldest value from the running stats once the window is full
+    if history['filled'] == max_points:
+        history['sum_y'] -= float(y[idx])
+    else:
+        history['filled'] += 1
+
+    history['x'][idx] = history['x'][idx + max_points] = frame_number
+    y[idx] = y[idx + max_points] = photon_count
+    history['sum_y'] += float(y[idx])
+    history['write_idx'] += 1
+
+    # Resynchronize once per lap so rounding error cannot accumulate
+    # (amortized O(1))
+    if idx == max_points - 1:
+        history['sum_y'] = float(np.sum(y[:max_points], dtype=np.float64))
+
+
+def append_history_batch(
+    history: Dict,
+    frame_numbers: Sequence[int],
+    photon_counts: Sequence[float]
 ):
     """
-    Update plot with new data point.
+    Append several data points to the plot history at once.
+
+    Equivalent to calling append_history() for each point, but writes each
+    buffer with at most two slice assignments (wrap-around). Points that
+    would be evicted again within the same batch are never written.
+
+    Parameters
+    ----------
+    history : dict
+        Dictionary from create_plot_history()
+    frame_numbers : sequence of int
+        New frame numbers, oldest first
+    photon_counts : sequence of float
+        New photon counts, oldest first
+
+    Examples
+    --------
+    >>> append_history_batch(history, [100, 101, 102], [500.5, 498.2, 502.0])
+    """
+    max_points = history['max_points']
+    x_new = np.asarray(frame_numbers, dtype=history['x'].dtype)
+    y_new = np.asarray(photon_counts, dtype=history['y'].dtype)
+    k = len(y_new)
+
+    # Only the newest max_points can survive this batch
+    if k > max_points:
+        history['write_idx'] += k - max_points
+        x_new = x_new[-max_points:]
+        y_new = y_new[-max_points:]
+        k = max_points
+
+    # Oldest values about to be overwritten, for the running sum
+    evicted = max(0, history['filled'] + k - max_points)
+    if evicted:
+        _, old_y = history_view(history)
+        history['sum_y'] -= float(np.sum(old_y[:evicted], dtype=np.float64))
+
+    # Write both ring copies: [start, N) then wrap to [0, k - (N - start))
+    start = history['write_idx'] % max_points
+    n1 = min(k, max_points - start)
+    n2 = k - n1
+    for buf, new in ((history['x'], x_new), (history['y'], y_new)):
+        buf[start:start + n1] = buf[start + max_points:start + max_points + n1] = new[:n1]
+        buf[:n2] = buf[max_points:max_points + n2] = new[n1:]
+
+    history['write_idx'] += k
+    history['filled'] = min(max_points, history['filled'] + k)
+    history['sum_y'] += float(np.sum(y_new, dtype=np.float64))
+
+    # Resynchronize once per lap so rounding error cannot accumulate
+    if start + k >= max_points:
+        _, data_y = history_view(history)
+        history['sum_y'] = float(np.sum(data_y, dtype=np.float64))
+
+
+def history_view(history: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get plot history in chronological order as contiguous array views.
+
+    Parameters
+    ----------
+    history : dict
+        Dictionary from create_plot_history()
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (x, y) views into the history buffers, oldest point first.
+        Only valid until the next append_history()
+
+    Examples
+    --------
+    >>> x, y = history_view(history)
+    """
+    filled = history['filled']
+    if filled < history['max_points']:
+        return history['x'][:filled], history['y'][:filled]
+
+    # Buffer has wrapped: oldest point sits at the write position, and the
+    # mirrored second half continues the ring without a seam
+    start = history['write_idx'] % history['max_points']
+    end = start + history['max_points']
+    return history['x'][start:end], history['y'][start:end]
+
+
+def lttb_downsample(
+    x: np.ndarray,
+    y: np.ndarray,
+    n_out: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a line with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and splits the rest into n_out - 2
+    buckets. From each bucket it keeps the point that forms the largest
+    triangle with the mean of the previous bucket and the mean of the next
+    bucket. Using the previous bucket's mean instead of the previously
+    selected point lets every bucket be scored at once, with no Python loop.
+    Preserves the visual shape of the curve far better than striding.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        X values, sorted ascending
+    y : np.ndarray
+        Y values
+    n_out : int
+        Number of points to keep
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (x, y) downsampled arrays, or the inputs if already small enough
+
+    Examples
+    --------
+    >>> x_ds, y_ds = lttb_downsample(data_x, data_y, n_out=2000)
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    # Interior points as an (n_out - 2, width) grid of indices, one row per
+    # bucket. Shorter buckets are padded with their first point, which maps
+    # back to the same index if it wins.
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    lo = edges[:-1]
+    counts = np.diff(edges)
+    offsets = np.arange(counts.max())
+    idx = np.where(
+        offsets < counts[:, None], lo[:, None] + offsets, lo[:, None]
+    )
+    bx = x[idx].astype(np.float64)
+    by = y[idx].astype(np.float64)
+
+    # Bucket means over the real (unpadded) points
+    mean_x = np.add.reduceat(x[:n - 1].astype(np.float64), lo) / counts
+    mean_y = np.add.reduceat(y[:n - 1].astype(np.float64), lo) / counts
+
+    # Triangle vertices: previous bucket mean (first point for the first
+    # bucket) and next bucket mean (last point for the last bucket)
+    prev_x = np.concatenate(([x[0]], mean_x[:-1]))
+    prev_y = np.concatenate(([y[0]], mean_y[:-1]))
+    next_x = np.concatenate((mean_x[1:], [x[-1]]))
+    next_y = np.concatenate((mean_y[1:], [y[-1]]))
+
+    # Twice the triangle area for every candidate in every bucket
+    area = np.abs(
+        (prev_x - next_x)[:, None] * (by - prev_y[:, None])
+        - (prev_x[:, None] - bx) * (next_y - prev_y)[:, None]
+    )
+    best = idx[np.arange(len(lo)), np.argmax(area, axis=1)]
+
+    keep = np.concatenate(([0], best, [n - 1]))
+    return x[keep], y[keep]
+
+
+class StreamingCurve(pg.PlotCurveItem):
+    """
+    Plot curve backed by a fixed-size plot history ring.
+
+    push() and push_batch() only write into the ring; refresh() hands the
+    current window to the curve in a single setData() call. Since frame
+    numbers are sorted, the x range is taken from the end points instead of
+    a min/max scan.
+
+    Parameters
+    ----------
+    max_points : int, optional
+        Number of points kept in the history. Default is 500
+    **kwargs
+        Forwarded to pg.PlotCurveItem (pen, skipFiniteCheck, connect, ...)
+
+    Examples
+    --------
+    >>> curve = StreamingCurve(500, pen='y', skipFiniteCheck=True)
+    >>> plot.addItem(curve)
+    >>> curve.push(100, 500.5)
+    >>> curve.refresh()
+    True
+    """
+
+    def __init__(self, max_points: int = 500, **kwargs):
+        super().__init__(**kwargs)
+        self.history = create_plot_history(max_points)
+        self.drawn_idx = 0  # history write_idx at the last refresh
+        self.max_draw_points = 0  # LTTB target, 0 = off
+
+    def push(self, frame_number: int, photon_count: float):
+        """Add one data point to the history without redrawing."""
+        append_history(self.history, frame_number, photon_count)
+
+    def push_batch(
+        self,
+        frame_numbers: Sequence[int],
+        photon_counts: Sequence[float]
+    ):
+        """Add a batch of data points, oldest first, without redrawing."""
+        append_history_batch(self.history, frame_numbers, photon_counts)
+
+    def refresh(self) -> bool:
+        """
+        Upload the current history window to the curve.
+
+        Returns
+        -------
+        bool
+            False if no point was added since the last refresh
+        """
+        if self.history['write_idx'] == self.drawn_idx:
+            return False
+        self.drawn_idx = self.history['write_idx']
+
+        data_x, data_y = history_view(self.history)
+        if self.max_draw_points and len(data_x) > self.max_draw_points:
+            data_x, data_y = lttb_downsample(
+                data_x, data_y, self.max_draw_points
+            )
+        self.setData(x=data_x, y=data_y, skipFiniteCheck=True, connect='all')
+        return True
+
+    def reset(self):
+        """Empty the history and the curve."""
+        self.history['write_idx'] = 0
+        self.history['filled'] = 0
+        self.history['sum_y'] = 0.0
+        self.drawn_idx = 0
+
+        # Empty views of the history buffers keep the curve's arrays typed
+        data_x, data_y = history_view(self.history)
+        self.setData(x=data_x, y=data_y, skipFiniteCheck=True, connect='all')
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        # Drawn x data is sorted (LTTB keeps both end points)
+        x = self.xData
+        if ax == 0 and frac >= 1.0 and orthoRange is None and x is not None \
+                and len(x):
+            return float(x[0]), float(x[-1])
+        return super().dataBounds(ax, frac, orthoRange)
+
+
+def push_sample(plot_dict: Dict, frame_number: int, photon_count: float):
+    """
+    Add a data point to the plot history without redrawing.
+
+    Cheap enough to call for every frame; the plot picks the point up on
+    the next redraw().
 
     Parameters
     ----------
     plot_dict : dict
         Dictionary from setup_plot() containing plot components
-    data_x : list
-        List of x-axis values (frame numbers)
-    data_y : list
-        List of y-axis values (photon counts)
     frame_number : int
-        Current frame number
+        Frame number
     photon_count : float
-        Current photon count
+        Photon count
 
     Examples
     --------
-    >>> data_x, data_y = [], []
-    >>> update_plot(plot_dict, data_x, data_y, 100, 500.5)
+    >>> push_sample(plot_dict, 100, 500.5)
     """
-    curve = plot_dict['curve']
-    text = plot_dict['text']
-    app = plot_dict['app']
+    plot_dict['curve'].push(frame_number, photon_count)
 
-    # Add new data
-    data_x.append(frame_number)
-    data_y.append(photon_count)
 
-    # Update curve
-    if len(data_x) > 0:
-        curve.setData(data_x, data_y)
+def push_samples(
+    plot_dict: Dict,
+    frame_numbers: Sequence[int],
+    photon_counts: Sequence[float]
+):
+    """
+    Add a batch of data points to the plot history without redrawing.
 
-        # Update text overlay
-        mean_photons = np.mean(data_y)
-        text.setText(
-            f"Current: {photon_count:.1f} photons/px\n"
-            f"Mean: {mean_photons:.1f} photons/px"
-        )
+    Prefer this over calling push_sample() in a loop when several samples
+    arrive between redraws.
 
-        if len(data_y) > 1:
-            text.setPos(data_x[0], max(data_y))
+    Parameters
+    ----------
+    plot_dict : dict
+        Dictionary from setup_plot() containing plot components
+    frame_numbers : sequence of int
+        Frame numbers, oldest first
+    photon_counts : sequence of float
+        Photon counts, oldest first
 
-        # Force Qt to process events
-        app.processEvents()
+    Examples
+    --------
+    >>> push_samples(plot_dict, [100, 101], [500.5, 498.2])
+    """
+    plot_dict['curve'].push_batch(frame_numbers, photon_counts)
 
 
-def limit_plot_history(data_x: List, data_y: List, max_points: int):
+def redraw(plot_dict: Dict):
     """
-    Limit plot data to maximum number of points.
+    Redraw the plot from the current plot history.
 
-    Modifies lists in-place.
+    Must be driven by a QTimer on the GUI thread (see create_timer()) while
+    the application event loop is running; it does not process Qt events
+    itself, so Qt can coalesce paint events. The curve is only redrawn if a
+    point was added since the last redraw. Histories longer than twice the
+    view width are reduced with lttb_downsample() first (see
+    StreamingCurve.refresh()), since the extra points cannot be seen. The
+    text overlay is refreshed on average every UI_REFRESH_MS while it lags
+    the curve, so it catches up even after the stream stops.
 
     Parameters
     ----------
-    data_x : list
-        X-axis data
-    data_y : list
-        Y-axis data
-    max_points : int
-        Maximum number of points to keep
+    plot_dict : dict
+        Dictionary from setup_plot() containing plot components
 
     Examples
     --------
-    >>> limit_plot_history(data_x, data_y, 500)
+    >>> timer = create_timer(lambda: redraw(plot_dict), interval_ms=33)
+    >>> timer.start()
     """
-    while len(data_x) > max_points:
-        data_x.pop(0)
-        data_y.pop(0)
+    history = plot_dict['history']
+
+    # Update curve
+    if plot_dict['curve'].refresh():
+        plot_dict['text_dirty'] = True
+
+    # Text overlay only needs a human-perceptible rate. Advancing the
+    # deadline instead of restarting the clock keeps the average rate at
+    # UI_REFRESH_MS even when it is not a multiple of the timer interval.
+    now_ms = plot_dict['ui_elapsed'].elapsed()
+    if not plot_dict['text_dirty'] or now_ms < plot_dict['text_due_ms']:
+        return
+    due_ms = max(plot_dict['text_due_ms'], now_ms - UI_REFRESH_MS)
+    plot_dict['text_due_ms'] = due_ms + UI_REFRESH_MS
+    plot_dict['text_dirty'] = False
 
+    # Update text overlay
+    mean_photons = history['sum_y'] / history['filled']
+    latest = history['y'][(history['write_idx'] - 1) % history['max_points']]
+    plot_dict['text'].setText(_TEXT_TEMPLATE.format(latest, mean_photons))
 
-def clear_plot(plot_dict: Dict, data_x: List, data_y: List):
+
+def update_plot(
+    plot_dict: Dict,
+    frame_numbers: Sequence[int],
+    photon_counts: Sequence[float]
+):
+    """
+    Update plot with a batch of new data points.
+
+    Convenience wrapper: push_samples() followed by one redraw().
+
+    Does not process Qt events. Must be called from within a QTimer callback
+    (see create_timer()) while the application event loop is running; do
+    not call from a tight Python loop.
+
+    Parameters
+    ----------
+    plot_dict : dict
+        Dictionary from setup_plot() containing plot components
+    frame_numbers : sequence of int
+        New frame numbers, oldest first
+    photon_counts : sequence of float
+        New photon counts, oldest first
+
+    Examples
+    --------
+    >>> update_plot(plot_dict, [100, 101], [500.5, 498.2])
+    """
+    push_samples(plot_dict, frame_numbers, photon_counts)
+    redraw(plot_dict)
+
+
+def clear_plot(plot_dict: Dict):
     """
     Clear all data from the plot.
 
@@ -167,27 +579,22 @@ def clear_plot(plot_dict: Dict, data_x: List, data_y: List):
     ----------
     plot_dict : dict
         Dictionary from setup_plot()
-    data_x : list
-        X-axis data to clear
-    data_y : list
-        Y-axis data to clear
 
     Examples
     --------
-    >>> clear_plot(plot_dict, data_x, data_y)
+    >>> clear_plot(plot_dict)
     """
-    curve = plot_dict['curve']
-    text = plot_dict['text']
-
-    data_x.clear()
-    data_y.clear()
-    curve.setData([], [])
-    text.setText("")
+    plot_dict['curve'].reset()
+    plot_dict['text'].setText("")
+    plot_dict['text_dirty'] = False
 
 
 def create_timer(callback, interval_ms: int = 0) -> QtCore.QTimer:
     """
-    Create a Qt timer for continuous acquisition.
+    Create a Qt timer for periodic work on the GUI thread.
+
+    This is how plot updates should be driven: the callback runs inside the
+    Qt event loop, which handles painting and input between calls.
 
     Parameters
     ----------
@@ -203,11 +610,11 @@ def create_timer(callback, interval_ms: int = 0) -> QtCore.QTimer:
 
     Examples
     --------
-    >>> def update_frame():
-    ...     print("Frame acquired")
-    >>> timer = create_timer(update_frame, interval_ms=0)
+    >>> timer = create_timer(lambda: redraw(plot_dict), interval_ms=33)
     >>> timer.start()
+    >>> plot_dict['app'].exec()
     """
     timer = QtCore.QTimer()
+    timer.setInterval(interval_ms)
     timer.timeout.connect(callback)
     return timer
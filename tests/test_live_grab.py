@@ -40,13 +40,21 @@ if image.IsIncomplete():
     print("Image incomplete:", image.GetImageStatus())
 else:
     width, height = image.GetWidth(), image.GetHeight()
-    arr = image.GetNDArray()
+    arr = image.GetNDArray().copy()  # stays valid after Release()
     print(f"Image size: {width} x {height}")
     print(f"Mean pixel value: {arr.mean():.2f}")
 
 image.Release()
 cam.EndAcquisition()
 
+# %%
+# Check the ROI reduction used by the live monitor against numpy
+# (exercises the numba kernel when numba is installed)
+from acquisition import extract_roi, roi_mean
+
+roi = extract_roi(arr, (200, 200))
+print(f"roi_mean: {roi_mean(roi):.3f} | numpy mean: {roi.mean():.3f}")
+
 # %%
 # Display captured frame
 